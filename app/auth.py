@@ -1,7 +1,16 @@
 from passlib.context import CryptContext
 
-# Create password context using bcrypt
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# Create password context using argon2id (OWASP minimum settings, ~30 ms per
+# hash vs ~250 ms for bcrypt at 12 rounds). bcrypt stays listed so existing
+# hashes still verify; they are marked deprecated and replaced on next login.
+pwd_context = CryptContext(
+    schemes=["argon2", "bcrypt"],
+    deprecated="auto",
+    argon2__type="ID",
+    argon2__time_cost=2,
+    argon2__memory_cost=19456,
+    argon2__parallelism=1
+)
 
 def hash_password(password: str) -> str:
     """Hash a plain text password"""
@@ -9,4 +18,8 @@ def hash_password(password: str) -> str:
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """Verify a plain text password against a hashed password"""
-    return pwd_context.verify(plain_password, hashed_password)
\ No newline at end of file
+    return pwd_context.verify(plain_password, hashed_password)
+
+def verify_and_update_password(plain_password: str, hashed_password: str):
+    """Verify a password, returning (is_valid, new_hash); new_hash is set when the stored hash should be upgraded"""
+    return pwd_context.verify_and_update(plain_password, hashed_password)
\ No newline at end of file
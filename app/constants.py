@@ -16,6 +16,13 @@ Each section has clear instructions on how to add your own rules!
 =============================================================================
 """
 
+import re
+from functools import lru_cache
+
+# Bank statements repeat the same stores and categories many times, so the
+# pure string helpers below are memoized
+_CACHE_SIZE = 4096
+
 CATEGORY_MAPPING = {
     # Income variations
     "other income": "Other Income",
@@ -66,7 +73,7 @@ CATEGORY_MAPPING = {
     "furniture": "Household",
     "gift": "Gifts",
     "present": "Gifts",
-    "other expense": "Other",
+    "other expense": "Other Expense",
     "miscellaneous": "Other",
     "misc": "Other",
     "fun money": "Entertainment",
@@ -76,8 +83,6 @@ CATEGORY_MAPPING = {
     "netflix": "Subscriptions",
     "spotify": "Subscriptions",
     "phone storage": "Subscriptions",
-    "other expense": "Other Expense",
-    "other income": "Other Income"
 }
 
 
@@ -120,6 +125,11 @@ INCOME_CATEGORIES = [
 # =============================================================================
 ALL_CATEGORIES = sorted(EXPENSE_CATEGORIES + INCOME_CATEGORIES)
 
+# Lookup helpers built once from the lists above
+_ALL_CATEGORIES_SET = frozenset(ALL_CATEGORIES)
+_ALL_CATEGORIES_LOWER = {category.lower(): category for category in ALL_CATEGORIES}
+_INCOME_CATEGORIES_SET = frozenset(INCOME_CATEGORIES)
+
 
 # =============================================================================
 # 📦 STORE NAME NORMALIZATION RULES
@@ -260,7 +270,55 @@ STORE_EXACT_MATCH = {
     # "abbreviation": "Full Name",
 }
 
-
+def _trie_regex(words) -> str:
+    """
+    Build a regex matching any of the given words, factored into a prefix trie.
+    
+    Shared prefixes are only tried once (e.g. "costco" and "costco gas" become
+    "costco(?: gas)?"), so matching cost grows with the length of the text
+    rather than with the number of words.
+    """
+    trie = {}
+    for word in words:
+        node = trie
+        for char in word:
+            node = node.setdefault(char, {})
+        node[""] = {}  # end of word marker
+    
+    def build(node: dict) -> str:
+        branches = [re.escape(char) + build(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ""
+        body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+        return "(?:" + body + ")?" if "" in node else body
+    
+    return build(trie)
+
+
+# Every STORE_PATTERNS key compiled into one trie-shaped regex, so a single
+# scan finds a pattern at the leftmost matching position in the store name
+_STORE_PATTERNS_RE = re.compile(_trie_regex(STORE_PATTERNS))
+_STORE_PATTERN_KEYS = tuple(STORE_PATTERNS.keys())
+_STORE_PATTERN_VALUES = tuple(STORE_PATTERNS.values())
+_STORE_PATTERN_INDEX = {pattern: i for i, pattern in enumerate(_STORE_PATTERN_KEYS)}
+
+# Cleanup patterns used by normalize_store(), compiled once at import
+_RE_MERCHANT_CODE = re.compile(r'\*[A-Z0-9]+')
+_RE_HASH_NUMBER = re.compile(r'#\d+')
+_RE_TRAILING_NUMBER = re.compile(r'\s+\d{4,}')
+_RE_MKTPL = re.compile(r'Mktpl[ace]*\s*')
+_RE_PMT = re.compile(r'Pmts?\s*')
+_RE_DOT_COM = re.compile(r'\.com', re.IGNORECASE)
+
+# Common business suffixes stripped from the end of store names
+BUSINESS_SUFFIXES = ['Inc', 'LLC', 'Corp', 'Ltd', 'Co', 'Company', 'US']
+_RE_BUSINESS_SUFFIX = re.compile(
+    r'(?:\s+(?:' + '|'.join(BUSINESS_SUFFIXES) + r')\.?)+$',
+    re.IGNORECASE,
+)
+
+
+@lru_cache(maxsize=_CACHE_SIZE)
 def normalize_store(store: str) -> str:
     """
     Normalize a store name to standard format.
@@ -283,37 +341,33 @@ def normalize_store(store: str) -> str:
     if store_lower in STORE_EXACT_MATCH:
         return STORE_EXACT_MATCH[store_lower]
     
-    # Step 2: Check pattern matches
-    for pattern, clean_name in STORE_PATTERNS.items():
-        if pattern in store_lower:
-            return clean_name
+    # Step 2: Check pattern matches (first pattern in STORE_PATTERNS order wins)
+    match = _STORE_PATTERNS_RE.search(store_lower)
+    if match:
+        # Only patterns listed before the hit can take priority over it
+        hit_index = _STORE_PATTERN_INDEX[match.group(0)]
+        for i in range(hit_index):
+            if _STORE_PATTERN_KEYS[i] in store_lower:
+                return _STORE_PATTERN_VALUES[i]
+        return _STORE_PATTERN_VALUES[hit_index]
     
     # Step 3: Clean up the store name
     cleaned = original
     
     # Remove common credit card merchant codes and numbers at the end
     # Examples: "Target 00002204", "Amazon Mktpl*6Z7Xf0Y53"
-    import re
+    cleaned = _RE_MERCHANT_CODE.sub('', cleaned)  # Remove *ABC123
+    cleaned = _RE_HASH_NUMBER.sub('', cleaned)  # Remove #12345
+    cleaned = _RE_TRAILING_NUMBER.sub('', cleaned)  # Remove 4+ digit numbers at end
+    cleaned = _RE_MKTPL.sub('', cleaned)  # Remove "Mktpl", "Mktplace"
+    cleaned = _RE_PMT.sub('', cleaned)  # Remove "Pmt", "Pmts"
+    cleaned = _RE_DOT_COM.sub('', cleaned)  # Remove ".com", ".COM"
     
-    # Remove patterns like: *XXXXXX, #XXXXX, store code numbers
-    cleaned = re.sub(r'\*[A-Z0-9]+', '', cleaned)  # Remove *ABC123
-    cleaned = re.sub(r'#\d+', '', cleaned)  # Remove #12345
-    cleaned = re.sub(r'\s+\d{4,}', '', cleaned)  # Remove 4+ digit numbers at end
-    cleaned = re.sub(r'Mktpl[ace]*\s*', '', cleaned)  # Remove "Mktpl", "Mktplace"
-    cleaned = re.sub(r'Pmts?\s*', '', cleaned)  # Remove "Pmt", "Pmts"
-    cleaned = re.sub(r'.com', '', cleaned)
-    cleaned = re.sub(r'.Com', '', cleaned) 
-
-    
-    # Remove common business suffixes
-    suffixes = ['Inc', 'LLC', 'Corp', 'Ltd', 'Co', 'Company', 'US']
-    for suffix in suffixes:
-        # Remove suffix if at end with optional period
-        cleaned = re.sub(rf'\s+{suffix}\.?$', '', cleaned, flags=re.IGNORECASE)
+    # Remove common business suffixes (with optional period) at the end
+    cleaned = _RE_BUSINESS_SUFFIX.sub('', cleaned)
     
-    # Clean up extra spaces and special characters
-    cleaned = re.sub(r'\s+', ' ', cleaned)  # Multiple spaces to single space
-    cleaned = cleaned.strip()
+    # Collapse runs of whitespace to a single space and trim the ends
+    cleaned = ' '.join(cleaned.split())
     
     # Title case the result
     return cleaned.title() if cleaned else original.title()
@@ -329,141 +383,176 @@ def normalize_store(store: str) -> str:
 # =============================================================================
 # HOW TO ADD YOUR OWN CATEGORY RULES:
 #
-# Edit the functions below (categorize_by_store, categorize_by_keywords)
+# Edit the rule lists below (STORE_CATEGORY_RULES, KEYWORD_CATEGORY_RULES)
 # 
-# categorize_by_store() - For specific stores you always categorize the same
-# categorize_by_keywords() - For keyword matching in descriptions
+# STORE_CATEGORY_RULES - For specific stores you always categorize the same
+# KEYWORD_CATEGORY_RULES - For keyword matching in descriptions
+#
+# Each rule is (category, [keywords]). Rules are checked top to bottom and
+# the first rule with a keyword found IN the (lowercase) text wins.
 #
-# These functions are called by the CSV parser to suggest categories.
+# categorize_by_store() and categorize_by_keywords() apply these rules and
+# are called by the CSV parser to suggest categories.
 # =============================================================================
 
-def categorize_by_store(store_name: str) -> str:
-    """
-    Categorize based on known store names.
-    Add your own store → category mappings here!
-    
-    Returns category name or None if no match
-    """
-    store_lower = store_name.lower()
-    
+STORE_CATEGORY_RULES = [
     # Groceries
-    if any(s in store_lower for s in ['cub', 'hyvee', 'hy-vee', 'target', 'walmart', 'costco', 'whole foods', 'trader joe', 'kroger', 'safeway', 'aldi', 'publix', 'lunds', 'byerlys']):
-        return "Groceries"
+    ("Groceries", ['cub', 'hyvee', 'hy-vee', 'target', 'walmart', 'costco', 'whole foods', 'trader joe', 'kroger', 'safeway', 'aldi', 'publix', 'lunds', 'byerlys']),
     
     # Dining - Fast Food
-    if any(s in store_lower for s in ['fuzzy', 'jimmy john', 'scoreboard', 'jersey mike', 'culvers', "culver's", 'cuisine', 'mcdonald', 'burger king', 'taco bell', 'chipotle', 'subway', 'kfc', 'wendys', 'chick-fil-a', 'popeyes', 'canes', "cane's"]):
-        return "Dining"
+    ("Dining", ['fuzzy', 'jimmy john', 'scoreboard', 'jersey mike', 'culvers', "culver's", 'cuisine', 'mcdonald', 'burger king', 'taco bell', 'chipotle', 'subway', 'kfc', 'wendys', 'chick-fil-a', 'popeyes', 'canes', "cane's"]),
     
     # Dining - Restaurants
-    if any(s in store_lower for s in ['dugarels', 'sweetgreen', 'piada', 'kitchen', 'mexican', 'burger', 'pub', 'tavern', 'taqueria', 'starbucks', 'poke', 'restaurant', 'cafe', 'coffee', 'pizza', 'panera', 'spitz', 'bistro', 'taphouse', 'tap house', 'tap room', 'taco', 'tacos']):
-        return "Dining"
+    ("Dining", ['dugarels', 'sweetgreen', 'piada', 'kitchen', 'mexican', 'burger', 'pub', 'tavern', 'taqueria', 'starbucks', 'poke', 'restaurant', 'cafe', 'coffee', 'pizza', 'panera', 'spitz', 'bistro', 'taphouse', 'tap house', 'tap room', 'taco', 'tacos']),
     
     # Gas & Auto
-    if any(s in store_lower for s in ['parkade', 'auto', 'napa', 'valvoline', 'kwik trip', 'marathon', 'speedway', 'holliday', 'holiday', 'shell', 'chevron', 'exxon', 'mobil', 'bp', 'gas', 'fuel', 'costco gas', 'tires', 'oil']):
-        return "Gas & Auto"
+    ("Gas & Auto", ['parkade', 'auto', 'napa', 'valvoline', 'kwik trip', 'marathon', 'speedway', 'holliday', 'holiday', 'shell', 'chevron', 'exxon', 'mobil', 'bp', 'gas', 'fuel', 'costco gas', 'tires', 'oil']),
     
     # Subscriptions
-    if any(s in store_lower for s in ['netflix', 'spotify', 'hulu', 'disney', 'apple music', 'icloud', 'dropbox', 'apple']):
-        return "Subscriptions"
+    ("Subscriptions", ['netflix', 'spotify', 'hulu', 'disney', 'apple music', 'icloud', 'dropbox', 'apple']),
     
     # Online Shopping
-    if any(s in store_lower for s in ['kohl', 'records', 'antiques', 'amazon', 'ebay', 'etsy', 'patina', 'sierra', 'kohls', 'hollister', 'american eagle', 'lulu lemon']):
-        return "Shopping"
+    ("Shopping", ['kohl', 'records', 'antiques', 'amazon', 'ebay', 'etsy', 'patina', 'sierra', 'kohls', 'hollister', 'american eagle', 'lulu lemon']),
     
     # Health & Fitness
-    if any(s in store_lower for s in ['jellos', 'barbershop', 'cvs', 'walgreens', 'pharmacy', 'gym', 'fitness', 'planet', 'planet fit', 'planet fitness']):
-        return "Health & Fitness"
+    ("Health & Fitness", ['jellos', 'barbershop', 'cvs', 'walgreens', 'pharmacy', 'gym', 'fitness', 'planet', 'planet fit', 'planet fitness']),
     
     # Phone/Internet
-    if any(s in store_lower for s in ['conservice', 'xcel', 'energy', 'centerpoint', 'center point', 'quantum fiber', 'verizon', 'at&t', 't-mobile', 'sprint', 'xfinity', 'comcast']):
-        # Could be Phone or Utilities depending on service
-        return "Utilities"  # Default to Phone, user can adjust
+    # Could be Phone or Utilities depending on service - default to Utilities, user can adjust
+    ("Utilities", ['conservice', 'xcel', 'energy', 'centerpoint', 'center point', 'quantum fiber', 'verizon', 'at&t', 't-mobile', 'sprint', 'xfinity', 'comcast']),
     
     # Transportation
-    if any(s in store_lower for s in ['navigo', 'paris', 'lyon', 'france', 'uber', 'lyft', "plane", "delta", "airline", "sun country"]):
-        return "Travel"
+    ("Travel", ['navigo', 'paris', 'lyon', 'france', 'uber', 'lyft', "plane", "delta", "airline", "sun country"]),
     
     # Entertainment
-    if any(s in store_lower for s in ['brewing', 'brewery', 'rabbit hole', 'liquor', 'bar', 'golf', 'course', 'club', 'cider', 'cowboy jacks', 'wine', 'total wine', 'beer', 'alcohol', 'winery', 'cidery']):
-        return "Entertainment"
+    ("Entertainment", ['brewing', 'brewery', 'rabbit hole', 'liquor', 'bar', 'golf', 'course', 'club', 'cider', 'cowboy jacks', 'wine', 'total wine', 'beer', 'alcohol', 'winery', 'cidery']),
 
     # interest
-    if any(s in store_lower for s in ['interest']):
-        return "Interest"
+    ("Interest", ['interest']),
     
     # car payment
-    if any(s in store_lower for s in ['auto loan', 'car payment', 'vehicle loan', "truck loan" , 'southpoint']):
-        return "Car Payment"
+    ("Car Payment", ['auto loan', 'car payment', 'vehicle loan', "truck loan" , 'southpoint']),
     
     # student loan
-    if any(s in store_lower for s in ['student loan', 'navient', 'great lakes', 'fedloan', 'dept educ']):
-        return "Student Loan"
+    ("Student Loan", ['student loan', 'navient', 'great lakes', 'fedloan', 'dept educ']),
     
     # refund
-    if any(s in store_lower for s in ['refund']):
-        return "Refund"
+    ("Refund", ['refund']),
     
     # salary
-    if any(s in store_lower for s in ['mom brands pay','direct deposit', 'payroll', 'salary', 'northern', 'nte', 'best buy', 'bby', 'bestbuy', 'post consumer brand', 'pcb']):
-        return "Salary"
+    ("Salary", ['mom brands pay','direct deposit', 'payroll', 'salary', 'northern', 'nte', 'best buy', 'bby', 'bestbuy', 'post consumer brand', 'pcb']),
     
     # Rent
-    if any(word in store_lower for word in ['rent', 'apartment', 'housing', "alcott", "whitecap", "nolo"]):
-        return "Rent"
+    ("Rent", ['rent', 'apartment', 'housing', "alcott", "whitecap", "nolo"]),
     
     # Education
-    if any(word in store_lower for word in ['univ. of iowa', 'und', 'ndus', 'ndsu']):
-        return "Education"
-    
+    ("Education", ['univ. of iowa', 'und', 'ndus', 'ndsu']),
     
     # Add your own store categorization rules here:
-    # if 'your_store' in store_lower:
-    #     return "Your Category"
-    
-    return None
-
+    # ("Your Category", ['your_store']),
+]
 
-def categorize_by_keywords(description: str, transaction_type: str = "") -> str:
-    """
-    Categorize based on keywords in the description or transaction type.
-    Add your own keyword → category rules here!
-    
-    Returns category name or None if no match
-    """
-    desc_lower = description.lower()
-    type_lower = transaction_type.lower()
-    
-    # Interest
-    if 'interest' in desc_lower or 'interest' in type_lower:
-        return "Interest"
-    
+KEYWORD_CATEGORY_RULES = [
     # Salary/Payroll
-    if any(word in desc_lower for word in ['payroll', 'salary', 'direct deposit', "best buy", "bby", "northern", "nte", "pcb", "post consumer brand"]):
-        return "Salary"
+    ("Salary", ['payroll', 'salary', 'direct deposit', "best buy", "bby", "northern", "nte", "pcb", "post consumer brand"]),
     
     # Rent
-    if any(word in desc_lower for word in ['rent', 'apartment', 'housing', "alcott", "whitecap", "nolo"]):
-        return "Rent"
+    ("Rent", ['rent', 'apartment', 'housing', "alcott", "whitecap", "nolo"]),
     
     # Utilities
-    if any(word in desc_lower for word in ['electric', 'water', 'utility', 'gas bill', 'internet', "xcel", "centerpoint", "quantum"]):
-        return "Utilities"
+    ("Utilities", ['electric', 'water', 'utility', 'gas bill', 'internet', "xcel", "centerpoint", "quantum"]),
     
     # Student Loan
-    if any(word in desc_lower for word in ['student loan', 'navient', 'great lakes', 'fedloan', 'dept educ']):
-        return "Student Loan"
+    ("Student Loan", ['student loan', 'navient', 'great lakes', 'fedloan', 'dept educ']),
     
     # Car Payment
-    if any(word in desc_lower for word in ['auto loan', 'car payment', 'vehicle loan', "truck loan" , "southpoint"]):
-        return "Car Payment"
+    ("Car Payment", ['auto loan', 'car payment', 'vehicle loan', "truck loan" , "southpoint"]),
     
     # Add your own keyword categorization rules here:
-    # if 'your_keyword' in desc_lower:
-    #     return "Your Category"
+    # ("Your Category", ['your_keyword']),
+]
+
+
+def _keyword_regex(keywords: list):
+    """Compile keywords into one regex alternation (None if there are no keywords)"""
+    if not keywords:
+        return None
+    return re.compile('|'.join(re.escape(keyword) for keyword in keywords))
+
+
+def _compile_category_rules(rules: list) -> list:
+    """Compile each rule's keywords into one regex alternation, keeping rule order"""
+    return [(_keyword_regex(keywords), category) for category, keywords in rules]
+
+
+_STORE_CATEGORY_RES = _compile_category_rules(STORE_CATEGORY_RULES)
+_KEYWORD_CATEGORY_RES = _compile_category_rules(KEYWORD_CATEGORY_RULES)
+
+def _index_rule_keywords(rules: list) -> dict:
+    """Map each keyword to the index of the first rule that lists it"""
+    keyword_rule = {}
+    for rule_index, (category, keywords) in enumerate(rules):
+        for keyword in keywords:
+            keyword_rule.setdefault(keyword, rule_index)
+    return keyword_rule
+
+
+# Inverted index over all store keywords, plus one trie regex to find a
+# candidate rule in a single scan
+_STORE_KEYWORD_RULE = _index_rule_keywords(STORE_CATEGORY_RULES)
+_STORE_KEYWORDS_RE = re.compile(_trie_regex(_STORE_KEYWORD_RULE))
+
+
+def _categorize_by_store_lower(store_lower: str) -> str:
+    """categorize_by_store() for an already-lowercased store name"""
+    match = _STORE_KEYWORDS_RE.search(store_lower)
+    if not match:
+        return None
+    
+    # Only rules listed before the matched keyword's rule can take priority over it
+    hit_index = _STORE_KEYWORD_RULE[match.group(0)]
+    for pattern, category in _STORE_CATEGORY_RES[:hit_index]:
+        if pattern and pattern.search(store_lower):
+            return category
+    return _STORE_CATEGORY_RES[hit_index][1]
+
+
+def _categorize_by_keywords_lower(desc_lower: str, type_lower: str) -> str:
+    """categorize_by_keywords() for an already-lowercased description and type"""
+    # Interest
+    if 'interest' in desc_lower or 'interest' in type_lower:
+        return "Interest"
+    
+    for pattern, category in _KEYWORD_CATEGORY_RES:
+        if pattern and pattern.search(desc_lower):
+            return category
     
     return None
 
 
+@lru_cache(maxsize=_CACHE_SIZE)
+def categorize_by_store(store_name: str) -> str:
+    """
+    Categorize based on known store names.
+    Add your own store → category mappings to STORE_CATEGORY_RULES!
+    
+    Returns category name or None if no match
+    """
+    return _categorize_by_store_lower(store_name.lower())
+
+
+@lru_cache(maxsize=_CACHE_SIZE)
+def categorize_by_keywords(description: str, transaction_type: str = "") -> str:
+    """
+    Categorize based on keywords in the description or transaction type.
+    Add your own keyword → category rules to KEYWORD_CATEGORY_RULES!
+    
+    Returns category name or None if no match
+    """
+    return _categorize_by_keywords_lower(description.lower(), transaction_type.lower())
+
+
+@lru_cache(maxsize=_CACHE_SIZE)
 def suggest_category(store: str, description: str, transaction_type: str = "") -> str:
     """
     Main function to suggest a category for a transaction.
@@ -472,12 +561,12 @@ def suggest_category(store: str, description: str, transaction_type: str = "") -
     Returns a suggested category or "Other Expense" as fallback.
     """
     # Try store-based categorization first
-    category = categorize_by_store(store)
+    category = _categorize_by_store_lower(store.lower())
     if category:
         return category
     
     # Try keyword-based categorization
-    category = categorize_by_keywords(description, transaction_type)
+    category = _categorize_by_keywords_lower(description.lower(), transaction_type.lower())
     if category:
         return category
     
@@ -490,15 +579,39 @@ def suggest_category(store: str, description: str, transaction_type: str = "") -
 # =============================================================================
 # HOW TO ADD AUTOMATIC TAGS:
 #
-# Edit the get_automatic_tags() function below.
+# Edit the AUTOMATIC_TAG_RULES list below.
+# Each rule is (tag, [store keywords], [description keywords]) - the tag is
+# added if any store keyword is IN the store name or any description
+# keyword is IN the description.
 # Tags are automatically added based on store name or transaction details.
 # These tags are added WITHOUT user input.
 # =============================================================================
 
+AUTOMATIC_TAG_RULES = [
+    # Golf tag (if you play golf)
+    ("golf", ['golf', 'pga', 'course', "club"], ['golf', 'tee time', "club", "course"]),
+    
+    # Vacation/Travel tag
+    ("vacation", ['airline', 'hotel', 'airbnb', 'booking.com', 'expedia'], []),
+    
+    # Add your own automatic tagging rules here:
+    # ("your_tag", ['store keyword'], ['description keyword']),
+]
+
+_AUTOMATIC_TAG_RES = [
+    (tag, _keyword_regex(store_keywords), _keyword_regex(description_keywords))
+    for tag, store_keywords, description_keywords in AUTOMATIC_TAG_RULES
+]
+
+
+# Categories that get the automatic "food" tag
+_FOOD_CATEGORIES = frozenset({"Groceries", "Dining"})
+
+
 def get_automatic_tags(store: str, category: str, amount: float, description: str = "") -> list:
     """
     Generate automatic tags based on transaction details.
-    Add your own auto-tagging rules here!
+    Add your own auto-tagging rules to AUTOMATIC_TAG_RULES!
     
     Returns a list of tags to automatically apply.
     """
@@ -511,22 +624,15 @@ def get_automatic_tags(store: str, category: str, amount: float, description: st
     if category == "Subscriptions":
         tags.append("recurring")
     
-    # Golf tag (if you play golf)
-    if any(word in store_lower for word in ['golf', 'pga', 'course', "club"]) or any(word in desc_lower for word in ['golf', 'tee time', "club", "course"]):
-        tags.append("golf")
-    
-    # Vacation/Travel tag
-    if any(word in store_lower for word in ['airline', 'hotel', 'airbnb', 'booking.com', 'expedia']):
-        tags.append("vacation")
+    # Keyword-based tags
+    for tag, store_pattern, desc_pattern in _AUTOMATIC_TAG_RES:
+        if (store_pattern and store_pattern.search(store_lower)) or (desc_pattern and desc_pattern.search(desc_lower)):
+            tags.append(tag)
     
     # Weekly groceries tag
-    if category == "Groceries" | category == "Dining":
+    if category in _FOOD_CATEGORIES:
         tags.append("food")
     
-    # Add your own automatic tagging rules here:
-    # if 'condition' in store_lower:
-    #     tags.append("your_tag")'
-    
     return tags
 
 
@@ -537,6 +643,7 @@ def get_automatic_tags(store: str, category: str, amount: float, description: st
 #
 # Edit the CATEGORY_TAGS dictionary below.
 # These are tag suggestions shown to the user based on the category they select.
+# STORE_TAG_SUGGESTIONS adds suggestions based on keywords in the store name.
 # Users click to add them, but they're not automatic.
 # =============================================================================
 
@@ -553,33 +660,44 @@ CATEGORY_TAGS = {
     # "Your Category": ["tag1", "tag2", "tag3"],
 }
 
+# Top 4 suggestions per category, sliced once at import
+_CATEGORY_TOP_TAGS = {category: tuple(tags[:4]) for category, tags in CATEGORY_TAGS.items()}
+
+# Store-based tag suggestions: (tag, [store keywords])
+STORE_TAG_SUGGESTIONS = [
+    ("dining", ['restaurant', 'cafe']),
+    ("fitness", ['gym', 'fitness']),
+    
+    # Add your own store keyword → suggested tag here:
+    # ("your_tag", ['store keyword']),
+]
+
+_STORE_TAG_RES = [(tag, _keyword_regex(keywords)) for tag, keywords in STORE_TAG_SUGGESTIONS]
+
 
 def suggest_tags(category: str, store: str = "") -> list:
     """
     Suggest tags based on category and store name.
     Returns a list of suggested tag strings shown to the user.
     """
-    suggestions = []
-    
-    # Add category-based tags
-    if category in CATEGORY_TAGS:
-        suggestions.extend(CATEGORY_TAGS[category][:4])  # Top 4 suggestions
+    # Add category-based tags (top 4 suggestions)
+    suggestions = list(_CATEGORY_TOP_TAGS.get(category, ()))
     
     # Add store-specific tags if applicable
     if store:
         store_lower = store.lower()
-        if "restaurant" in store_lower or "cafe" in store_lower:
-            suggestions.append("dining")
-        if "gym" in store_lower or "fitness" in store_lower:
-            suggestions.append("fitness")
+        for tag, pattern in _STORE_TAG_RES:
+            if pattern and pattern.search(store_lower):
+                suggestions.append(tag)
     
-    return list(set(suggestions))  # Remove duplicates
+    return list(dict.fromkeys(suggestions))  # Remove duplicates, keeping order
 
 
 # =============================================================================
 # HELPER FUNCTIONS
 # =============================================================================
 
+@lru_cache(maxsize=_CACHE_SIZE)
 def normalize_category(category: str) -> str:
     """
     Normalize a category name to the standard format.
@@ -596,26 +714,28 @@ def normalize_category(category: str) -> str:
         return CATEGORY_MAPPING[category_lower]
     
     # Check if it matches any standard category (case-insensitive)
-    for std_category in ALL_CATEGORIES:
-        if category_lower == std_category.lower():
-            return std_category
+    std_category = _ALL_CATEGORIES_LOWER.get(category_lower)
+    if std_category:
+        return std_category
     
     # If not found, return Title Case version
     return category.title()
 
 
+@lru_cache(maxsize=_CACHE_SIZE)
 def is_valid_category(category: str) -> bool:
     """Check if a category is valid"""
     if not category:
         return False
-    return normalize_category(category) in ALL_CATEGORIES
+    return normalize_category(category) in _ALL_CATEGORIES_SET
 
 
+@lru_cache(maxsize=_CACHE_SIZE)
 def get_transaction_type(category: str) -> str:
     """
     Determine if a category is 'income' or 'expense'
     """
     normalized = normalize_category(category)
-    if normalized in INCOME_CATEGORIES:
+    if normalized in _INCOME_CATEGORIES_SET:
         return "income"
     return "expense"
\ No newline at end of file
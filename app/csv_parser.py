@@ -9,12 +9,80 @@ they ALWAYS go through cleanup and business rules from constants.py.
 """
 
 import csv
+import re
+import sys
 from io import StringIO
-from datetime import datetime
-from typing import List, Tuple, Dict, Optional
+from itertools import chain
+from datetime import date, datetime
+from functools import lru_cache
+from typing import List, Tuple, Dict, Optional, Iterable, Iterator, NamedTuple, Union
 from .constants import normalize_store, suggest_category, normalize_category
 
 
+# CSV input: the whole file as a string, or an iterable of text lines (e.g. a
+# decoded upload stream) so large files don't need to be held in memory twice
+CSVContent = Union[str, Iterable[str]]
+
+
+class CSVTransaction(NamedTuple):
+    """A single parsed CSV row (a tuple, so no per-row dict)"""
+    date: date
+    store: str
+    description: str
+    original_type: str
+    amount: float
+    type: str
+    suggested_category: str
+
+
+# Keyword lists used by backup_categorize(), built once at import
+_DINING_KEYWORDS = ("restaurant", "cafe", "coffee", "starbucks", "mcdonald", "burger",
+                    "pizza", "taco", "chipotle", "chick-fil", "culver", "wendy",
+                    "subway", "panera", "buffalo wild", "applebee", "olive garden",
+                    "bar", "pub", "grill", "tavern", "brewery", "doordash", "grubhub",
+                    "uber eats", "dining")
+_GROCERY_KEYWORDS = ("grocery", "hy-vee", "trader joe", "whole foods", "aldi",
+                     "kroger", "target", "costco", "walmart", "supermarket", "food")
+_GAS_KEYWORDS = ("gas", "fuel", "shell", "exxon", "mobil", "chevron", "bp",
+                 "marathon", "speedway", "kwik trip", "holiday")
+_SHOPPING_KEYWORDS = ("amazon", "ebay", "etsy", "store", "shop", "retail",
+                      "mall", "clothing", "apparel")
+_SUBSCRIPTION_KEYWORDS = ("netflix", "spotify", "hulu", "disney", "hbo",
+                          "subscription", "prime", "youtube", "internet", "phone bill")
+_UTILITY_KEYWORDS = ("electric", "water", "gas bill", "utility", "power", "energy")
+_HEALTH_KEYWORDS = ("gym", "fitness", "doctor", "hospital", "pharmacy", "medical",
+                    "dental", "health", "clinic")
+_ENTERTAINMENT_KEYWORDS = ("movie", "cinema", "theater", "concert", "ticket",
+                           "game", "entertainment")
+_TRAVEL_KEYWORDS = ("airline", "hotel", "airbnb", "uber", "lyft", "taxi",
+                    "rental car", "flight", "travel")
+
+# Expense rules checked in order after the income checks: (category, keywords)
+_BACKUP_CATEGORY_RULES = [
+    ("Dining", _DINING_KEYWORDS),
+    ("Groceries", _GROCERY_KEYWORDS),
+    ("Gas", _GAS_KEYWORDS),
+    ("Shopping", _SHOPPING_KEYWORDS),
+    ("Subscriptions", _SUBSCRIPTION_KEYWORDS),
+    ("Utilities", _UTILITY_KEYWORDS),
+    ("Rent", ("rent", "lease", "mortgage")),
+    ("Health & Fitness", _HEALTH_KEYWORDS),
+    ("Entertainment", _ENTERTAINMENT_KEYWORDS),
+    ("Travel", _TRAVEL_KEYWORDS),
+    ("Education", ("school", "education", "tuition", "university")),
+    ("Credit Card Payment", ("credit card", "payment")),
+    ("Loan Payment", ("loan",)),
+    ("ATM/Cash", ("atm", "cash", "withdrawal")),
+]
+
+# One compiled alternation per rule, so each rule is a single search()
+_BACKUP_CATEGORY_RES = [
+    (re.compile("|".join(re.escape(keyword) for keyword in keywords)), category)
+    for category, keywords in _BACKUP_CATEGORY_RULES
+]
+
+
+@lru_cache(maxsize=4096)
 def backup_categorize(store: str, description: str, transaction_type: str) -> str:
     """
     Backup categorization when constants.py doesn't return a category.
@@ -39,90 +107,76 @@ def backup_categorize(store: str, description: str, transaction_type: str) -> st
     if "transfer" in text and transaction_type == "income":
         return "Transfer"
     
-    # Expense categories - Dining
-    dining_keywords = ["restaurant", "cafe", "coffee", "starbucks", "mcdonald", "burger", 
-                      "pizza", "taco", "chipotle", "chick-fil", "culver", "wendy", 
-                      "subway", "panera", "buffalo wild", "applebee", "olive garden",
-                      "bar", "pub", "grill", "tavern", "brewery", "doordash", "grubhub", 
-                      "uber eats", "dining"]
-    if any(kw in text for kw in dining_keywords):
-        return "Dining"
-    
-    # Groceries
-    grocery_keywords = ["grocery", "hy-vee", "trader joe", "whole foods", "aldi", 
-                       "kroger", "target", "costco", "walmart", "supermarket", "food"]
-    if any(kw in text for kw in grocery_keywords):
-        return "Groceries"
-    
-    # Gas & Auto
-    gas_keywords = ["gas", "fuel", "shell", "exxon", "mobil", "chevron", "bp",
-                   "marathon", "speedway", "kwik trip", "holiday"]
-    if any(kw in text for kw in gas_keywords):
-        return "Gas"
-    
-    # Shopping
-    shopping_keywords = ["amazon", "ebay", "etsy", "store", "shop", "retail",
-                        "mall", "clothing", "apparel"]
-    if any(kw in text for kw in shopping_keywords):
-        return "Shopping"
-    
-    # Subscriptions
-    subscription_keywords = ["netflix", "spotify", "hulu", "disney", "hbo",
-                           "subscription", "prime", "youtube", "internet", "phone bill"]
-    if any(kw in text for kw in subscription_keywords):
-        return "Subscriptions"
-    
-    # Utilities
-    utility_keywords = ["electric", "water", "gas bill", "utility", "power", "energy"]
-    if any(kw in text for kw in utility_keywords):
-        return "Utilities"
-    
-    # Rent/Mortgage
-    if "rent" in text or "lease" in text or "mortgage" in text:
-        return "Rent"
-    
-    # Health & Fitness
-    health_keywords = ["gym", "fitness", "doctor", "hospital", "pharmacy", "medical",
-                      "dental", "health", "clinic"]
-    if any(kw in text for kw in health_keywords):
-        return "Health & Fitness"
-    
-    # Entertainment
-    entertainment_keywords = ["movie", "cinema", "theater", "concert", "ticket",
-                             "game", "entertainment"]
-    if any(kw in text for kw in entertainment_keywords):
-        return "Entertainment"
-    
-    # Travel
-    travel_keywords = ["airline", "hotel", "airbnb", "uber", "lyft", "taxi",
-                      "rental car", "flight", "travel"]
-    if any(kw in text for kw in travel_keywords):
-        return "Travel"
-    
-    # Education
-    if "school" in text or "education" in text or "tuition" in text or "university" in text:
-        return "Education"
-    
-    # Credit Card Payment
-    if "credit card" in text or "payment" in text:
-        return "Credit Card Payment"
-    
-    # Loan Payment
-    if "loan" in text:
-        return "Loan Payment"
-    
-    # ATM/Cash
-    if "atm" in text or "cash" in text or "withdrawal" in text:
-        return "ATM/Cash"
+    # Expense categories, in _BACKUP_CATEGORY_RULES order
+    for pattern, category in _BACKUP_CATEGORY_RES:
+        if pattern.search(text):
+            return category
     
     # Default to "Other" or "Other Income"
     return "Other"
 
 
+def _csv_lines(content: CSVContent) -> Iterable[str]:
+    """Wrap whole-file strings for the csv module; line iterables are used as-is"""
+    return StringIO(content) if isinstance(content, str) else content
+
+
+def _read_csv(content: CSVContent) -> Tuple[Dict[str, int], Iterator[List[str]]]:
+    """Read the header row and return (column index by header name, row reader)"""
+    reader = csv.reader(_csv_lines(content))
+    header = next(reader, [])
+    return {name: i for i, name in enumerate(header)}, reader
+
+
+def _report_skipped_rows(skipped_rows: List[Tuple[List[str], Exception]]) -> None:
+    """Print one summary line for the rows a parser had to skip"""
+    if skipped_rows:
+        row, error = skipped_rows[0]
+        print(f"Error parsing {len(skipped_rows)} row(s), first: {row}, Error: {error}")
+
+
+# Supported date formats, grouped by shape and in the order they are tried
+_DASH_DATE_FORMATS = ("%Y-%m-%d",)
+_SLASH_FULL_YEAR_DATE_FORMATS = ("%m/%d/%Y", "%d/%m/%Y")
+_SLASH_SHORT_YEAR_DATE_FORMATS = ("%m/%d/%y", "%d/%m/%y")
+
+# Zero-padded YYYY-MM-DD and MM/DD/YYYY, the shapes the bank exports use
+_ISO_DATE_RE = re.compile(r"(\d{4})-(\d\d)-(\d\d)", re.ASCII)
+_US_DATE_RE = re.compile(r"(\d\d)/(\d\d)/(\d{4})", re.ASCII)
+
+
+# Exports repeat the same dates across many rows, so parsed dates are memoized
+@lru_cache(maxsize=4096)
 def parse_date(date_str: str) -> datetime:
     """Parse date string in multiple formats"""
-    # Try common date formats
-    for fmt in ["%Y-%m-%d", "%m/%d/%Y", "%m/%d/%y", "%d/%m/%Y", "%d/%m/%y"]:
+    # Fast path: build the date directly for the common zero-padded shapes
+    match = _ISO_DATE_RE.fullmatch(date_str)
+    if match:
+        year, month, day = match.groups()
+    else:
+        match = _US_DATE_RE.fullmatch(date_str)
+        if match:
+            month, day, year = match.groups()
+    if match:
+        try:
+            return date(int(year), int(month), int(day))
+        except ValueError:
+            pass  # Not a valid month/day (e.g. 13/01/2024), try the formats below
+    
+    # Only try the formats that can match this shape of string, so a
+    # typical date takes a single strptime() call
+    if "-" in date_str:
+        formats = _DASH_DATE_FORMATS
+    else:
+        year = date_str.rpartition("/")[2]
+        if len(year) == 4:
+            formats = _SLASH_FULL_YEAR_DATE_FORMATS
+        elif len(year) == 2:
+            formats = _SLASH_SHORT_YEAR_DATE_FORMATS
+        else:
+            formats = ()
+    
+    for fmt in formats:
         try:
             return datetime.strptime(date_str, fmt).date()
         except ValueError:
@@ -130,7 +184,7 @@ def parse_date(date_str: str) -> datetime:
     raise ValueError(f"Unable to parse date: {date_str}")
 
 
-def parse_sofi_csv(content: str, account_type: str = "savings") -> List[dict]:
+def parse_sofi_csv(content: CSVContent, account_type: str = "savings") -> List[CSVTransaction]:
     """
     Parse SoFi CSV format (both Savings and Checking).
     Format: Date, Description, Type, Amount, Current balance, Status
@@ -141,20 +195,33 @@ def parse_sofi_csv(content: str, account_type: str = "savings") -> List[dict]:
     - category: auto-categorized using constants.py
     """
     transactions = []
-    reader = csv.DictReader(StringIO(content))
+    skipped_rows = []
+    columns, reader = _read_csv(content)
+    date_i = columns.get("Date")
+    description_i = columns.get("Description")
+    type_i = columns.get("Type")
+    amount_i = columns.get("Amount")
+    status_i = columns.get("Status")
     
     for row in reader:
+        if not row:
+            continue  # Skip blank lines
         try:
-            date_str = row.get("Date", "").strip()
-            original_description = row.get("Description", "").strip()
-            trans_type = row.get("Type", "").strip()
-            amount_str = row.get("Amount", "0").strip()
-            status = row.get("Status", "").strip()
+            date_str = row[date_i].strip() if date_i is not None else ""
+            original_description = row[description_i].strip() if description_i is not None else ""
+            # Interned: only a handful of distinct types, repeated on every row
+            trans_type = sys.intern(row[type_i].strip()) if type_i is not None else ""
+            amount_str = row[amount_i].strip() if amount_i is not None else "0"
+            status = row[status_i].strip() if status_i is not None else ""
             
             # Skip pending transactions
             if status.lower() != "posted":
                 continue
             
+            # Skip rows with no amount
+            if not amount_str:
+                continue
+            
             # Parse amount
             amount = float(amount_str.replace(",", "").replace("$", ""))
             
@@ -182,23 +249,25 @@ def parse_sofi_csv(content: str, account_type: str = "savings") -> List[dict]:
             if not suggested_category or suggested_category == "":
                 suggested_category = "Other Income" if income_expense_type == "income" else "Other"
             
-            transactions.append({
-                "date": parse_date(date_str),
-                "store": store,
-                "description": "",  # Leave blank by default
-                "original_type": trans_type,
-                "amount": amount,
-                "type": income_expense_type,
-                "suggested_category": suggested_category,
-            })
-        except Exception as e:
-            print(f"Error parsing row: {row}, Error: {e}")
+            transactions.append(CSVTransaction(
+                date=parse_date(date_str),
+                store=store,
+                description="",  # Leave blank by default
+                original_type=trans_type,
+                amount=amount,
+                type=income_expense_type,
+                suggested_category=suggested_category,
+            ))
+        except (ValueError, IndexError) as e:
+            # Malformed row (bad number/date or missing fields)
+            skipped_rows.append((row, e))
             continue
     
+    _report_skipped_rows(skipped_rows)
     return transactions
 
 
-def parse_capital_one_csv(content: str) -> List[dict]:
+def parse_capital_one_csv(content: CSVContent) -> List[CSVTransaction]:
     """
     Parse Capital One CSV format.
     Format: Transaction Date, Posted Date, Card No., Description, Category, Debit, Credit
@@ -209,15 +278,24 @@ def parse_capital_one_csv(content: str) -> List[dict]:
     - category: auto-categorized using constants.py
     """
     transactions = []
-    reader = csv.DictReader(StringIO(content))
+    skipped_rows = []
+    columns, reader = _read_csv(content)
+    date_i = columns.get("Transaction Date")
+    description_i = columns.get("Description")
+    debit_i = columns.get("Debit")
+    credit_i = columns.get("Credit")
+    category_i = columns.get("Category")
     
     for row in reader:
+        if not row:
+            continue  # Skip blank lines
         try:
-            date_str = row.get("Transaction Date", "").strip()
-            original_description = row.get("Description", "").strip()
-            debit_str = row.get("Debit", "").strip()
-            credit_str = row.get("Credit", "").strip()
-            original_category = row.get("Category", "").strip()
+            date_str = row[date_i].strip() if date_i is not None else ""
+            original_description = row[description_i].strip() if description_i is not None else ""
+            debit_str = row[debit_i].strip() if debit_i is not None else ""
+            credit_str = row[credit_i].strip() if credit_i is not None else ""
+            # Interned: only a handful of distinct categories, repeated on every row
+            original_category = sys.intern(row[category_i].strip()) if category_i is not None else ""
             
             # Determine amount and type based on debit/credit columns
             if debit_str and debit_str != "":
@@ -229,13 +307,13 @@ def parse_capital_one_csv(content: str) -> List[dict]:
             else:
                 continue  # Skip rows with no amount
             
+            # Skip autopay payments ("capital one autopay pymt" included)
+            if "autopay" in original_description.lower():
+                continue
+            
             # Normalize store name using constants.py
             store = normalize_store(original_description)
             
-            # Skip autopay payments
-            if "autopay" in original_description.lower() or "capital one autopay pymt" in original_description.lower():
-                continue
-            
             # Auto-categorize using constants.py (ignore Capital One's category)
             suggested_category = suggest_category(store, original_description, original_category)
             
@@ -250,23 +328,25 @@ def parse_capital_one_csv(content: str) -> List[dict]:
             if not suggested_category or suggested_category == "":
                 suggested_category = "Other Income" if income_expense_type == "income" else "Other"
             
-            transactions.append({
-                "date": parse_date(date_str),
-                "store": store,
-                "description": "",  # Leave blank by default
-                "original_type": original_category,
-                "amount": amount,
-                "type": income_expense_type,
-                "suggested_category": suggested_category,
-            })
-        except Exception as e:
-            print(f"Error parsing row: {row}, Error: {e}")
+            transactions.append(CSVTransaction(
+                date=parse_date(date_str),
+                store=store,
+                description="",  # Leave blank by default
+                original_type=original_category,
+                amount=amount,
+                type=income_expense_type,
+                suggested_category=suggested_category,
+            ))
+        except (ValueError, IndexError) as e:
+            # Malformed row (bad number/date or missing fields)
+            skipped_rows.append((row, e))
             continue
     
+    _report_skipped_rows(skipped_rows)
     return transactions
 
 
-def parse_generic_csv(content: str, column_mapping: Dict[str, Optional[str]]) -> List[dict]:
+def parse_generic_csv(content: CSVContent, column_mapping: Dict[str, Optional[str]]) -> List[CSVTransaction]:
     """
     Parse a generic CSV with custom column mappings.
     
@@ -274,7 +354,7 @@ def parse_generic_csv(content: str, column_mapping: Dict[str, Optional[str]]) ->
     cleanup and auto-categorization from constants.py business rules.
     
     Args:
-        content: CSV file content as string
+        content: CSV file content (string or iterable of lines)
         column_mapping: Dict with keys:
             - date_column: Required
             - amount_column: Optional (for single amount column)
@@ -285,10 +365,11 @@ def parse_generic_csv(content: str, column_mapping: Dict[str, Optional[str]]) ->
             - description_column: Optional
             - use_two_columns: Boolean
     
-    Returns: List of transaction dicts
+    Returns: List of CSVTransaction rows
     """
     transactions = []
-    reader = csv.DictReader(StringIO(content))
+    skipped_rows = []
+    columns, reader = _read_csv(content)
     
     date_col = column_mapping.get("date_column")
     amount_col = column_mapping.get("amount_column")
@@ -302,10 +383,20 @@ def parse_generic_csv(content: str, column_mapping: Dict[str, Optional[str]]) ->
     if not date_col:
         raise ValueError("Date column is required")
     
+    # Resolve mapped columns to row indices once (None if unmapped or not in the header)
+    date_i = columns.get(date_col)
+    amount_i = columns.get(amount_col) if amount_col else None
+    debit_i = columns.get(debit_col) if debit_col else None
+    credit_i = columns.get(credit_col) if credit_col else None
+    store_i = columns.get(store_col) if store_col else None
+    description_i = columns.get(description_col) if description_col else None
+    
     for row in reader:
+        if not row:
+            continue  # Skip blank lines
         try:
             # Parse date
-            date_str = row.get(date_col, "").strip()
+            date_str = row[date_i].strip() if date_i is not None else ""
             if not date_str:
                 continue
             trans_date = parse_date(date_str)
@@ -313,8 +404,8 @@ def parse_generic_csv(content: str, column_mapping: Dict[str, Optional[str]]) ->
             # Parse amount and determine type
             if use_two_cols:
                 # Two column format (debit/credit)
-                debit_str = row.get(debit_col, "").strip() if debit_col else ""
-                credit_str = row.get(credit_col, "").strip() if credit_col else ""
+                debit_str = row[debit_i].strip() if debit_i is not None else ""
+                credit_str = row[credit_i].strip() if credit_i is not None else ""
                 
                 if debit_str and debit_str != "":
                     amount = float(debit_str.replace(",", "").replace("$", ""))
@@ -328,7 +419,7 @@ def parse_generic_csv(content: str, column_mapping: Dict[str, Optional[str]]) ->
                 # Single column format
                 if not amount_col:
                     raise ValueError("Amount column is required for single-column format")
-                amount_str = row.get(amount_col, "").strip()
+                amount_str = row[amount_i].strip() if amount_i is not None else ""
                 if not amount_str:
                     continue
                 
@@ -342,13 +433,13 @@ def parse_generic_csv(content: str, column_mapping: Dict[str, Optional[str]]) ->
             
             # Get raw store value from mapped column (or use description as fallback)
             raw_store = ""
-            if store_col and store_col in row:
-                raw_store = row.get(store_col, "").strip()
+            if store_i is not None:
+                raw_store = row[store_i].strip()
             
             # Get description (optional)
             raw_description = ""
-            if description_col and description_col in row:
-                raw_description = row.get(description_col, "").strip()
+            if description_i is not None:
+                raw_description = row[description_i].strip()
             
             # Use description for store if store not mapped
             if not raw_store and raw_description:
@@ -375,33 +466,35 @@ def parse_generic_csv(content: str, column_mapping: Dict[str, Optional[str]]) ->
             if not suggested_category or suggested_category == "":
                 suggested_category = "Other Income" if income_expense_type == "income" else "Other"
             
-            transactions.append({
-                "date": trans_date,
-                "store": store,
-                "description": raw_description if description_col else "",
-                "original_type": "",  # No original type for generic CSVs
-                "amount": amount,
-                "type": income_expense_type,
-                "suggested_category": suggested_category,
-            })
-        except Exception as e:
-            print(f"Error parsing row: {row}, Error: {e}")
+            transactions.append(CSVTransaction(
+                date=trans_date,
+                store=store,
+                description=raw_description if description_col else "",
+                original_type="",  # No original type for generic CSVs
+                amount=amount,
+                type=income_expense_type,
+                suggested_category=suggested_category,
+            ))
+        except (ValueError, IndexError) as e:
+            # Malformed row (bad number/date or missing fields)
+            skipped_rows.append((row, e))
             continue
     
+    _report_skipped_rows(skipped_rows)
     return transactions
 
 
-def get_csv_preview(content: str, max_rows: int = 5) -> Tuple[List[str], List[Dict[str, str]]]:
+def get_csv_preview(content: CSVContent, max_rows: int = 5) -> Tuple[List[str], List[Dict[str, str]]]:
     """
     Preview CSV file - return column headers and first few rows.
     
     Args:
-        content: CSV file content as string
+        content: CSV file content (string or iterable of lines)
         max_rows: Maximum number of sample rows to return
     
     Returns: (column_headers, sample_rows)
     """
-    reader = csv.DictReader(StringIO(content))
+    reader = csv.DictReader(_csv_lines(content))
     columns = reader.fieldnames or []
     
     sample_rows = []
@@ -417,7 +510,7 @@ def detect_bank_type(content: str) -> str:
     """
     Auto-detect the bank type based on CSV headers.
     """
-    first_line = content.split("\n")[0].lower()
+    first_line = content.partition("\n")[0].lower()
     
     if "card no." in first_line or ("debit" in first_line and "credit" in first_line):
         return "capital_one"
@@ -427,13 +520,13 @@ def detect_bank_type(content: str) -> str:
         return "unknown"
 
 
-def parse_csv(content: str, bank_type: str = None, column_mapping: Optional[Dict] = None) -> Tuple[str, List[dict]]:
+def parse_csv(content: CSVContent, bank_type: str = None, column_mapping: Optional[Dict] = None) -> Tuple[str, List[CSVTransaction]]:
     """
     Main entry point for parsing CSV.
     Auto-detects bank type if not specified, or uses custom column mapping.
     
     Args:
-        content: CSV file content
+        content: CSV file content (string or iterable of lines)
         bank_type: 'auto', 'sofi', 'capital_one', or 'generic'
         column_mapping: Optional dict with column mappings for generic parsing
     
@@ -446,7 +539,14 @@ def parse_csv(content: str, bank_type: str = None, column_mapping: Optional[Dict
     
     # Otherwise use bank-specific parsers
     if bank_type is None or bank_type == "auto":
-        bank_type = detect_bank_type(content)
+        if isinstance(content, str):
+            bank_type = detect_bank_type(content)
+        else:
+            # Peek at the header line, then put it back in front of the stream
+            lines = iter(content)
+            header_line = next(lines, "")
+            content = chain([header_line], lines)
+            bank_type = detect_bank_type(header_line)
     
     if bank_type == "capital_one":
         transactions = parse_capital_one_csv(content)
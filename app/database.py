@@ -1,27 +1,78 @@
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.orm import sessionmaker, scoped_session
+from contextvars import ContextVar
 import os
 
 # DATABASE_URL environment variable allows switching between local SQLite and Cloud SQL
 SQLALCHEMY_DATABASE_URL = os.getenv("DATABASE_URL", "sqlite:///C:/Users/Grant Hollar/OneDrive/Personal Desktop/Pet Projects/Finance App/finance.db")
 
 # create_engine() creates the connection to the database
-engine = create_engine(
-    SQLALCHEMY_DATABASE_URL, 
-    connect_args={"check_same_thread": False} if "sqlite" in SQLALCHEMY_DATABASE_URL else {}
-)
+if "sqlite" in SQLALCHEMY_DATABASE_URL:
+    engine = create_engine(
+        SQLALCHEMY_DATABASE_URL, 
+        connect_args={"check_same_thread": False}
+    )
+else:
+    # Cloud SQL: reuse pooled connections across requests and check them
+    # before use so connections dropped by the server are replaced.
+    # Connections are also recycled hourly, ahead of server idle timeouts.
+    engine = create_engine(
+        SQLALCHEMY_DATABASE_URL,
+        pool_size=10,
+        max_overflow=20,
+        pool_timeout=30,
+        pool_recycle=3600,
+        pool_pre_ping=True
+    )
+
+# SQLite tuning applied to every new connection: WAL lets reads run during
+# writes and, with synchronous=NORMAL, avoids an fsync on every commit
+if "sqlite" in SQLALCHEMY_DATABASE_URL:
+    @event.listens_for(engine, "connect")
+    def _set_sqlite_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.execute("PRAGMA cache_size=-64000")  # ~64 MB page cache
+        cursor.execute("PRAGMA temp_store=MEMORY")
+        cursor.close()
 
-# sessionmaker creates a class to generate database sessions
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+# Identifies the request a session belongs to. Sync endpoints run in worker
+# threads, so sessions are scoped per request rather than per thread; the
+# context variable is carried into those threads with the request.
+request_scope: ContextVar = ContextVar("request_scope", default=None)
+
+# scoped_session hands out one session per request from a shared registry;
+# db_session_middleware sets request_scope and calls SessionLocal.remove()
+SessionLocal = scoped_session(
+    sessionmaker(autocommit=False, autoflush=False, bind=engine),
+    scopefunc=request_scope.get
+)
 
 # Base class for SQLAlchemy models
 Base = declarative_base()
 
-# Dependency function to get a session in routes
-def get_db():
-    db = SessionLocal()
+# HTTP middleware that gives each request its own scoped session and releases
+# it once the response is ready. Register it on any app serving get_db routes:
+# app.middleware("http")(db_session_middleware)
+async def db_session_middleware(request, call_next):
+    token = request_scope.set(object())
     try:
-        yield db
+        return await call_next(request)
     finally:
-        db.close()
\ No newline at end of file
+        SessionLocal.remove()
+        request_scope.reset(token)
+
+# Dependency function to get a session in routes
+def get_db():
+    if request_scope.get() is None:
+        # Outside db_session_middleware there is no request scope to share,
+        # so hand out a private session and close it when the route is done
+        db = SessionLocal.session_factory()
+        try:
+            yield db
+        finally:
+            db.close()
+    else:
+        yield SessionLocal()
\ No newline at end of file
@@ -1,12 +1,16 @@
 from fastapi import FastAPI, Depends, HTTPException, UploadFile, File, Form
 from fastapi.middleware.cors import CORSMiddleware
-from sqlalchemy.orm import Session
-from sqlalchemy import func
+from fastapi.responses import StreamingResponse
+from sqlalchemy.orm import Session, raiseload
+from sqlalchemy import func, exists
+from sqlalchemy.exc import IntegrityError
 from typing import Optional, List
 from datetime import date, datetime, timedelta
+import codecs
+from itertools import chain, islice
 from . import models, schemas
-from .database import Base, engine, get_db
-from .auth import hash_password, verify_password
+from .database import Base, engine, get_db, SessionLocal, db_session_middleware
+from .auth import hash_password, verify_and_update_password
 from .csv_parser import parse_csv, get_csv_preview
 from .schemas_csv import (
     ParsedTransaction, 
@@ -20,6 +24,12 @@ from .constants import INCOME_CATEGORIES, EXPENSE_CATEGORIES, ALL_CATEGORIES
 # Create tables if not exist
 Base.metadata.create_all(bind=engine)
 
+# create_all() only builds indexes along with new tables, so add any that
+# are missing from tables created before the index was declared
+for table in Base.metadata.sorted_tables:
+    for index in table.indexes:
+        index.create(bind=engine, checkfirst=True)
+
 app = FastAPI(title="Personal Finance API")
 
 # Add CORS middleware
@@ -31,6 +41,10 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Give each request its own scoped session and release it once the
+# response is ready
+app.middleware("http")(db_session_middleware)
+
 # ------------------- Categories -------------------
 @app.get("/categories")
 def get_categories():
@@ -49,10 +63,6 @@ def get_categories():
 def signup(user: schemas.UserCreate, db: Session = Depends(get_db)):
     """Create a new user account with hashed password"""
     try:
-        existing_user = db.query(models.User).filter(models.User.email == user.email).first()
-        if existing_user:
-            raise HTTPException(status_code=400, detail="Email already registered")
-        
         hashed_pwd = hash_password(user.password)
         db_user = models.User(
             first_name=user.first_name,
@@ -67,6 +77,10 @@ def signup(user: schemas.UserCreate, db: Session = Depends(get_db)):
         print(f"✅ User created: {db_user.email} (ID: {db_user.id})")
         return db_user
         
+    except IntegrityError:
+        # users.email is unique, so a duplicate signup fails on insert
+        db.rollback()
+        raise HTTPException(status_code=400, detail="Email already registered")
     except HTTPException:
         raise
     except Exception as e:
@@ -82,9 +96,15 @@ def login(credentials: schemas.LoginCredentials, db: Session = Depends(get_db)):
         if not user:
             raise HTTPException(status_code=401, detail="Invalid email or password")
         
-        if not verify_password(credentials.password, user.hashed_password):
+        is_valid, new_hash = verify_and_update_password(credentials.password, user.hashed_password)
+        if not is_valid:
             raise HTTPException(status_code=401, detail="Invalid email or password")
         
+        # Re-hash legacy bcrypt passwords with argon2 now that we have the plain text
+        if new_hash:
+            user.hashed_password = new_hash
+            db.commit()
+        
         print(f"✅ User logged in: {user.email} (ID: {user.id})")
         return user
         
@@ -99,8 +119,7 @@ def login(credentials: schemas.LoginCredentials, db: Session = Depends(get_db)):
 def create_upload_session(session: schemas.UploadSessionCreate, db: Session = Depends(get_db)):
     """Create a new upload session"""
     try:
-        user = db.query(models.User).filter(models.User.id == session.user_id).first()
-        if not user:
+        if not db.query(exists().where(models.User.id == session.user_id)).scalar():
             raise HTTPException(status_code=404, detail="User not found")
         
         db_session = models.UploadSession(
@@ -128,7 +147,7 @@ def create_upload_session(session: schemas.UploadSessionCreate, db: Session = De
 def get_user_upload_sessions(user_id: int, db: Session = Depends(get_db)):
     """Get all upload sessions for a user"""
     try:
-        sessions = db.query(models.UploadSession).filter(
+        sessions = db.query(models.UploadSession).options(raiseload("*")).filter(
             models.UploadSession.user_id == user_id
         ).order_by(models.UploadSession.upload_date.desc()).all()
         
@@ -183,14 +202,11 @@ def delete_upload_session(session_id: int, db: Session = Depends(get_db)):
         if not session:
             raise HTTPException(status_code=404, detail="Session not found")
         
-        # Delete all transactions in this session
-        transactions = db.query(models.Transaction).filter(
+        # Delete all transactions in this session with a single DELETE; none
+        # are loaded in this session, so there is nothing to synchronize
+        transaction_count = db.query(models.Transaction).filter(
             models.Transaction.upload_session_id == session_id
-        ).all()
-        
-        transaction_count = len(transactions)
-        for transaction in transactions:
-            db.delete(transaction)
+        ).delete(synchronize_session=False)
         
         # Delete the session
         db.delete(session)
@@ -212,10 +228,9 @@ def delete_upload_session(session_id: int, db: Session = Depends(get_db)):
 # ------------------- Transactions -------------------
 @app.post("/transactions/", response_model=schemas.TransactionOut)
 def create_transaction(transaction: schemas.TransactionCreate, db: Session = Depends(get_db)):
-    """Create a new transaction"""
+    """Create a new transaction (use /transactions/bulk-create to insert many in one commit)"""
     try:
-        user = db.query(models.User).filter(models.User.id == transaction.user_id).first()
-        if not user:
+        if not db.query(exists().where(models.User.id == transaction.user_id)).scalar():
             raise HTTPException(status_code=404, detail="User not found")
         
         db_transaction = models.Transaction(
@@ -244,19 +259,49 @@ def create_transaction(transaction: schemas.TransactionCreate, db: Session = Dep
         print(f"❌ Error creating transaction: {e}")
         raise HTTPException(status_code=500, detail=f"Database error: {str(e)}")
 
+_STREAM_BATCH_SIZE = 500
+
+def _stream_transactions(db: Session, first_batch, remaining):
+    """Yield transactions as a JSON array, closing the stream's session when done"""
+    try:
+        separator = "["
+        for transaction in chain(first_batch, remaining):
+            yield separator + schemas.TransactionOut.model_validate(transaction).model_dump_json()
+            separator = ","
+        yield "[]" if separator == "[" else "]"
+        
+    except Exception as e:
+        print(f"❌ Error streaming transactions: {e}")
+        raise
+    finally:
+        db.close()
+
 @app.get("/transactions/user/{user_id}", response_model=List[schemas.TransactionOut])
-def get_user_transactions(user_id: int, db: Session = Depends(get_db)):
-    """Get all transactions for a user"""
+def get_user_transactions(user_id: int):
+    """Get all transactions for a user, streamed so large histories are never held in memory at once"""
+    # The body is sent after the request's scoped session has been removed,
+    # so the stream uses a session of its own
+    db = SessionLocal.session_factory()
     try:
-        transactions = db.query(models.Transaction).filter(
+        # Response models carry no relationships, so refuse lazy loads rather
+        # than letting one slip in as a query per row
+        transactions = iter(db.query(models.Transaction).options(raiseload("*")).filter(
             models.Transaction.user_id == user_id
-        ).order_by(models.Transaction.transaction_date.desc()).all()
+        ).order_by(models.Transaction.transaction_date.desc()).yield_per(_STREAM_BATCH_SIZE))
         
-        return transactions
+        # Fetch the first batch up front so database errors still surface as
+        # a 500 before any of the response has been sent
+        first_batch = list(islice(transactions, _STREAM_BATCH_SIZE))
         
     except Exception as e:
+        db.close()
         print(f"❌ Error fetching transactions: {e}")
         raise HTTPException(status_code=500, detail=f"Database error: {str(e)}")
+    
+    return StreamingResponse(
+        _stream_transactions(db, first_batch, transactions),
+        media_type="application/json"
+    )
 
 @app.delete("/transactions/{transaction_id}")
 def delete_transaction(transaction_id: int, db: Session = Depends(get_db)):
@@ -342,18 +387,17 @@ def update_transaction(transaction_id: int, transaction_update: schemas.Transact
 
 # ------------------- CSV Upload & Parsing -------------------
 @app.post("/transactions/csv-preview", response_model=CSVPreviewResponse)
-async def preview_csv_file(file: UploadFile = File(...)):
+def preview_csv_file(file: UploadFile = File(...)):
     """
     Preview CSV file - returns column headers and sample rows.
     Used for the column mapping interface.
     """
     try:
-        # Read file content
-        content = await file.read()
-        content_str = content.decode("utf-8")
+        # Decode the upload line by line instead of reading it all into memory
+        lines = codecs.iterdecode(file.file, "utf-8")
         
         # Get preview
-        columns, sample_rows = get_csv_preview(content_str, max_rows=5)
+        columns, sample_rows = get_csv_preview(lines, max_rows=5)
         
         return CSVPreviewResponse(
             success=True,
@@ -367,7 +411,7 @@ async def preview_csv_file(file: UploadFile = File(...)):
         raise HTTPException(status_code=500, detail=f"Error previewing CSV: {str(e)}")
 
 @app.post("/transactions/parse-csv", response_model=CSVUploadResponse)
-async def parse_csv_file(
+def parse_csv_file(
     file: UploadFile = File(...),
     bank_type: Optional[str] = Form(default="auto")
 ):
@@ -376,23 +420,22 @@ async def parse_csv_file(
     Bank type options: 'auto', 'sofi', 'capital_one'
     """
     try:
-        # Read file content
-        content = await file.read()
-        content_str = content.decode("utf-8")
+        # Decode the upload line by line instead of reading it all into memory
+        lines = codecs.iterdecode(file.file, "utf-8")
         
         # Parse CSV
-        detected_type, transactions = parse_csv(content_str, bank_type)
+        detected_type, transactions = parse_csv(lines, bank_type)
         
         # Convert to response format
         parsed_transactions = [
             ParsedTransaction(
-                date=t["date"],
-                description=t["description"],
-                original_type=t["original_type"],
-                amount=t["amount"],
-                type=t["type"],
-                suggested_category=t.get("suggested_category"),
-                store=t.get("store")
+                date=t.date,
+                description=t.description,
+                original_type=t.original_type,
+                amount=t.amount,
+                type=t.type,
+                suggested_category=t.suggested_category,
+                store=t.store
             )
             for t in transactions
         ]
@@ -412,7 +455,7 @@ async def parse_csv_file(
         raise HTTPException(status_code=500, detail=f"Error parsing CSV: {str(e)}")
 
 @app.post("/transactions/parse-csv-with-mapping", response_model=CSVUploadResponse)
-async def parse_csv_with_mapping(
+def parse_csv_with_mapping(
     file: UploadFile = File(...),
     mapping_json: str = Form(...)
 ):
@@ -423,9 +466,8 @@ async def parse_csv_with_mapping(
     try:
         import json
         
-        # Read file content
-        content = await file.read()
-        content_str = content.decode("utf-8")
+        # Decode the upload line by line instead of reading it all into memory
+        lines = codecs.iterdecode(file.file, "utf-8")
         
         # Parse mapping from JSON string
         mapping_data = json.loads(mapping_json)
@@ -443,18 +485,18 @@ async def parse_csv_with_mapping(
         }
         
         # Parse CSV with column mapping
-        detected_type, transactions = parse_csv(content_str, bank_type="generic", column_mapping=column_mapping)
+        detected_type, transactions = parse_csv(lines, bank_type="generic", column_mapping=column_mapping)
         
         # Convert to response format
         parsed_transactions = [
             ParsedTransaction(
-                date=t["date"],
-                description=t["description"],
-                original_type=t["original_type"],
-                amount=t["amount"],
-                type=t["type"],
-                suggested_category=t.get("suggested_category"),
-                store=t.get("store")
+                date=t.date,
+                description=t.description,
+                original_type=t.original_type,
+                amount=t.amount,
+                type=t.type,
+                suggested_category=t.suggested_category,
+                store=t.store
             )
             for t in transactions
         ]
@@ -475,8 +517,38 @@ async def parse_csv_with_mapping(
         print(f"❌ Error parsing CSV with mapping: {e}")
         raise HTTPException(status_code=500, detail=f"Error parsing CSV: {str(e)}")
 
+def _bulk_transaction_rows(data: BulkTransactionCreate):
+    """Convert bulk-create payload dicts into Transaction insert rows, collecting per-row errors"""
+    rows = []
+    errors = []
+    
+    for idx, t in enumerate(data.transactions):
+        try:
+            trans_date = t["transaction_date"]
+            if isinstance(trans_date, str):
+                trans_date = datetime.strptime(trans_date, "%Y-%m-%d").date()
+            elif isinstance(trans_date, datetime):
+                trans_date = trans_date.date()
+            
+            rows.append({
+                "type": t["type"],
+                "category": t["category"],
+                "store": t.get("store") or None,
+                "amount": float(t["amount"]),
+                "description": t.get("description") or None,
+                "tag": t.get("tag") or None,
+                "transaction_date": trans_date,
+                "is_bulk_upload": t.get("is_bulk_upload", False),
+                "upload_session_id": t.get("upload_session_id"),
+                "user_id": data.user_id,
+            })
+        except Exception as e:
+            errors.append(f"Transaction {idx + 1}: {str(e)}")
+    
+    return rows, errors
+
 @app.post("/transactions/bulk-create")
-async def bulk_create_transactions(
+def bulk_create_transactions(
     data: BulkTransactionCreate,
     db: Session = Depends(get_db)
 ):
@@ -485,38 +557,14 @@ async def bulk_create_transactions(
     Used after reviewing parsed CSV transactions.
     """
     try:
-        user = db.query(models.User).filter(models.User.id == data.user_id).first()
-        if not user:
+        if not db.query(exists().where(models.User.id == data.user_id)).scalar():
             raise HTTPException(status_code=404, detail="User not found")
         
-        created_count = 0
-        errors = []
-        
-        for idx, t in enumerate(data.transactions):
-            try:
-                trans_date = t["transaction_date"]
-                if isinstance(trans_date, str):
-                    trans_date = datetime.strptime(trans_date, "%Y-%m-%d").date()
-                elif isinstance(trans_date, datetime):
-                    trans_date = trans_date.date()
-                
-                db_transaction = models.Transaction(
-                    type=t["type"],
-                    category=t["category"],
-                    store=t.get("store") or None,
-                    amount=float(t["amount"]),
-                    description=t.get("description") or None,
-                    tag=t.get("tag") or None,
-                    transaction_date=trans_date,
-                    is_bulk_upload=t.get("is_bulk_upload", False),
-                    upload_session_id=t.get("upload_session_id"),
-                    user_id=data.user_id
-                )
-                db.add(db_transaction)
-                created_count += 1
-            except Exception as e:
-                errors.append(f"Transaction {idx + 1}: {str(e)}")
+        rows, errors = _bulk_transaction_rows(data)
+        created_count = len(rows)
         
+        # One executemany INSERT instead of an ORM object + flush per row
+        db.bulk_insert_mappings(models.Transaction, rows)
         db.commit()
         
         return {
@@ -537,38 +585,14 @@ async def bulk_create_transactions(
 def create_bulk_transactions_alt(data: BulkTransactionCreate, db: Session = Depends(get_db)):
     """Create multiple transactions at once (alternative endpoint)"""
     try:
-        user = db.query(models.User).filter(models.User.id == data.user_id).first()
-        if not user:
+        if not db.query(exists().where(models.User.id == data.user_id)).scalar():
             raise HTTPException(status_code=404, detail="User not found")
         
-        created_count = 0
-        errors = []
-        
-        for idx, t in enumerate(data.transactions):
-            try:
-                trans_date = t["transaction_date"]
-                if isinstance(trans_date, str):
-                    trans_date = datetime.strptime(trans_date, "%Y-%m-%d").date()
-                elif isinstance(trans_date, datetime):
-                    trans_date = trans_date.date()
-                
-                db_transaction = models.Transaction(
-                    type=t["type"],
-                    category=t["category"],
-                    store=t.get("store") or None,
-                    amount=float(t["amount"]),
-                    description=t.get("description") or None,
-                    tag=t.get("tag") or None,
-                    transaction_date=trans_date,
-                    is_bulk_upload=t.get("is_bulk_upload", False),
-                    upload_session_id=t.get("upload_session_id"),
-                    user_id=data.user_id
-                )
-                db.add(db_transaction)
-                created_count += 1
-            except Exception as e:
-                errors.append(f"Transaction {idx + 1}: {str(e)}")
+        rows, errors = _bulk_transaction_rows(data)
+        created_count = len(rows)
         
+        # One executemany INSERT instead of an ORM object + flush per row
+        db.bulk_insert_mappings(models.Transaction, rows)
         db.commit()
         
         return {
@@ -590,16 +614,14 @@ def create_bulk_transactions_alt(data: BulkTransactionCreate, db: Session = Depe
 def create_account_definition(account_def: schemas.AccountDefinitionCreate, db: Session = Depends(get_db)):
     """Create a new account definition"""
     try:
-        user = db.query(models.User).filter(models.User.id == account_def.user_id).first()
-        if not user:
+        if not db.query(exists().where(models.User.id == account_def.user_id)).scalar():
             raise HTTPException(status_code=404, detail="User not found")
         
         # Check if account with same name already exists for this user
-        existing = db.query(models.AccountDefinition).filter(
+        if db.query(exists().where(
             models.AccountDefinition.user_id == account_def.user_id,
             models.AccountDefinition.name == account_def.name
-        ).first()
-        if existing:
+        )).scalar():
             raise HTTPException(status_code=400, detail="Account with this name already exists")
         
         db_account_def = models.AccountDefinition(**account_def.model_dump())
@@ -621,7 +643,7 @@ def create_account_definition(account_def: schemas.AccountDefinitionCreate, db:
 def get_user_account_definitions(user_id: int, db: Session = Depends(get_db)):
     """Get all account definitions for a user"""
     try:
-        account_defs = db.query(models.AccountDefinition).filter(
+        account_defs = db.query(models.AccountDefinition).options(raiseload("*")).filter(
             models.AccountDefinition.user_id == user_id
         ).order_by(models.AccountDefinition.category, models.AccountDefinition.name).all()
         
@@ -665,8 +687,7 @@ def delete_account_definition(account_def_id: int, db: Session = Depends(get_db)
 def create_account_record(record: schemas.AccountRecordCreate, db: Session = Depends(get_db)):
     """Create a single account record"""
     try:
-        user = db.query(models.User).filter(models.User.id == record.user_id).first()
-        if not user:
+        if not db.query(exists().where(models.User.id == record.user_id)).scalar():
             raise HTTPException(status_code=404, detail="User not found")
         
         account_def = db.query(models.AccountDefinition).filter(
@@ -694,8 +715,7 @@ def create_account_record(record: schemas.AccountRecordCreate, db: Session = Dep
 def create_bulk_account_records(data: schemas.BulkAccountRecordCreate, db: Session = Depends(get_db)):
     """Create records for all accounts on a specific date"""
     try:
-        user = db.query(models.User).filter(models.User.id == data.user_id).first()
-        if not user:
+        if not db.query(exists().where(models.User.id == data.user_id)).scalar():
             raise HTTPException(status_code=404, detail="User not found")
         
         created_count = 0
@@ -703,11 +723,9 @@ def create_bulk_account_records(data: schemas.BulkAccountRecordCreate, db: Sessi
         
         for record_item in data.records:
             try:
-                account_def = db.query(models.AccountDefinition).filter(
+                if not db.query(exists().where(
                     models.AccountDefinition.id == record_item.account_definition_id
-                ).first()
-                
-                if not account_def:
+                )).scalar():
                     errors.append(f"Account definition {record_item.account_definition_id} not found")
                     continue
                 
@@ -797,9 +815,11 @@ def get_record_dates(user_id: int, db: Session = Depends(get_db)):
 def get_account_analytics(user_id: int, db: Session = Depends(get_db)):
     """Get account analytics including net worth history and trends"""
     try:
-        # Get all records with account info
+        # Get all records with account info (only the columns used below,
+        # so no AccountRecord objects are built)
         records = db.query(
-            models.AccountRecord,
+            models.AccountRecord.record_date,
+            models.AccountRecord.balance,
             models.AccountDefinition.name,
             models.AccountDefinition.category
         ).join(
@@ -826,8 +846,8 @@ def get_account_analytics(user_id: int, db: Session = Depends(get_db)):
         
         # Group by date
         by_date = {}
-        for record, name, category in records:
-            date_key = str(record.record_date)
+        for record_date, balance, name, category in records:
+            date_key = str(record_date)
             if date_key not in by_date:
                 by_date[date_key] = {
                     "date": date_key,
@@ -838,13 +858,13 @@ def get_account_analytics(user_id: int, db: Session = Depends(get_db)):
                 }
             
             if category == "liquid":
-                by_date[date_key]["liquid"] += record.balance
+                by_date[date_key]["liquid"] += balance
             elif category == "investments":
-                by_date[date_key]["investments"] += record.balance
+                by_date[date_key]["investments"] += balance
             elif category == "debt":
-                by_date[date_key]["debt"] += record.balance
+                by_date[date_key]["debt"] += balance
             
-            by_date[date_key]["accounts"][name] = record.balance
+            by_date[date_key]["accounts"][name] = balance
         
         # Calculate net worth for each date
         net_worth_history = []
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Float, ForeignKey, DateTime, Date, Boolean
+from sqlalchemy import Column, Integer, String, Float, ForeignKey, DateTime, Date, Boolean, Index
 from sqlalchemy.orm import relationship
 from datetime import datetime
 from .database import Base
@@ -50,6 +50,9 @@ class Transaction(Base):
     user = relationship("User", back_populates="transactions")
     upload_session = relationship("UploadSession", back_populates="transactions")
 
+    # Per-user transaction lists are filtered by user and ordered by date
+    __table_args__ = (Index("ix_transactions_user_id_transaction_date", "user_id", "transaction_date"),)
+
 
 class AccountDefinition(Base):
     """Defines an account (e.g., 'Chase Checking', '401k')"""
@@ -76,4 +79,7 @@ class AccountRecord(Base):
     user_id = Column(Integer, ForeignKey("users.id"))
 
     account_definition = relationship("AccountDefinition", back_populates="records")
-    user = relationship("User", back_populates="account_records")
\ No newline at end of file
+    user = relationship("User", back_populates="account_records")
+
+    # Account history and analytics are filtered by user and ordered by date
+    __table_args__ = (Index("ix_account_records_user_id_record_date", "user_id", "record_date"),)
\ No newline at end of file
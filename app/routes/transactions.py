@@ -1,5 +1,6 @@
 # import libraries
 from fastapi import APIRouter, Depends, HTTPException
+from sqlalchemy import case, func
 from sqlalchemy.orm import Session
 from .. import models, schemas
 from ..database import get_db
@@ -8,7 +9,7 @@ from ..database import get_db
 router = APIRouter(prefix="/transactions", tags=["Transactions"])
 
 # Endpoint to add a transaction
-@router.post("/", response_model=schemas.Transaction)
+@router.post("/", response_model=schemas.TransactionOut)
 def create_transaction(transaction: schemas.TransactionCreate, user_id: int, db: Session = Depends(get_db)):
     # Check if user exists
     user = db.query(models.User).filter(models.User.id == user_id).first()
@@ -25,18 +26,25 @@ def create_transaction(transaction: schemas.TransactionCreate, user_id: int, db:
 # Endpoint to get summary of a user's transactions
 @router.get("/summary/{user_id}")
 def get_summary(user_id: int, db: Session = Depends(get_db)):
-    # Query all transactions for this user
-    transactions = db.query(models.Transaction).filter(models.Transaction.user_id == user_id).all()
+    # Let the database total income and expenses in one aggregate query
+    # instead of loading every transaction row
+    def total(transaction_type):
+        return func.coalesce(func.sum(case(
+            (models.Transaction.type == transaction_type, models.Transaction.amount),
+            else_=0
+        )), 0)
 
-    # Calculate total income, expenses, and balance
-    income = sum(t.amount for t in transactions if t.type == "income")
-    expense = sum(t.amount for t in transactions if t.type == "expense")
+    income, expense = db.query(total("income"), total("expense")).filter(
+        models.Transaction.user_id == user_id
+    ).one()
+
+    # Calculate balance
     balance = income - expense
 
     return {"income": income, "expense": expense, "balance": balance}
 
 # Get all transactions for a user
-@router.get("/user/{user_id}", response_model=list[schemas.Transaction])
+@router.get("/user/{user_id}", response_model=list[schemas.TransactionOut])
 def list_transactions(user_id: int, db: Session = Depends(get_db)):
     rows = db.query(models.Transaction).filter(models.Transaction.user_id == user_id).order_by(models.Transaction.date.desc()).all()
     return rows
\ No newline at end of file
@@ -0,0 +1,6 @@
+import os
+import tempfile
+
+# Point the app at a throwaway SQLite database before any test imports it
+_db_dir = tempfile.mkdtemp()
+os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(_db_dir, 'test.db')}"
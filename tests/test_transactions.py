@@ -0,0 +1,91 @@
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app import main
+from app.database import SessionLocal, db_session_middleware
+from app.main import app
+from app.routes import transactions as transaction_routes
+
+client = TestClient(app)
+
+
+def _create_user(email):
+    res = client.post("/signup", json={
+        "first_name": "Test",
+        "last_name": "User",
+        "email": email,
+        "password": "secret1"
+    })
+    assert res.status_code == 200
+    return res.json()["id"]
+
+
+def _create_transaction(user_id, type, amount, day="2024-01-05"):
+    res = client.post("/transactions/", json={
+        "type": type,
+        "category": "Groceries" if type == "expense" else "Paycheck",
+        "store": "Target",
+        "amount": amount,
+        "transaction_date": day,
+        "user_id": user_id
+    })
+    assert res.status_code == 200
+
+
+def test_get_user_transactions_streams_rows(monkeypatch):
+    # A batch size of one makes the response span the prefetched first
+    # batch and the rest of the stream
+    monkeypatch.setattr(main, "_STREAM_BATCH_SIZE", 1)
+    user_id = _create_user("stream@example.com")
+    _create_transaction(user_id, "expense", 12.5, "2024-01-05")
+    _create_transaction(user_id, "expense", 40.0, "2024-02-10")
+
+    res = client.get(f"/transactions/user/{user_id}")
+
+    assert res.status_code == 200
+    rows = res.json()
+    assert [row["transaction_date"] for row in rows] == ["2024-02-10", "2024-01-05"]
+    assert [row["amount"] for row in rows] == [40.0, 12.5]
+    assert rows[0]["store"] == "Target"
+
+
+def test_get_user_transactions_empty():
+    user_id = _create_user("empty@example.com")
+
+    res = client.get(f"/transactions/user/{user_id}")
+
+    assert res.status_code == 200
+    assert res.json() == []
+
+
+def _summary_client():
+    # The transactions router is not mounted by app.main, so serve it directly
+    summary_app = FastAPI()
+    summary_app.middleware("http")(db_session_middleware)
+    summary_app.include_router(transaction_routes.router)
+    return TestClient(summary_app)
+
+
+def test_get_summary_totals_income_and_expense():
+    summary_client = _summary_client()
+    user_id = _create_user("summary@example.com")
+    _create_transaction(user_id, "income", 100.0)
+    _create_transaction(user_id, "expense", 20.0)
+    _create_transaction(user_id, "expense", 11.5)
+
+    res = summary_client.get(f"/transactions/summary/{user_id}")
+
+    assert res.status_code == 200
+    assert res.json() == {"income": 100.0, "expense": 31.5, "balance": 68.5}
+    # Nothing is left behind in the shared (request-less) registry slot
+    assert not SessionLocal.registry.has()
+
+
+def test_get_summary_without_transactions():
+    summary_client = _summary_client()
+    user_id = _create_user("nosummary@example.com")
+
+    res = summary_client.get(f"/transactions/summary/{user_id}")
+
+    assert res.status_code == 200
+    assert res.json() == {"income": 0, "expense": 0, "balance": 0}